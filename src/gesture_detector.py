@@ -6,18 +6,27 @@ MediaPipe Face Meshを使用して顔のランドマークを検出し、
 各種ジェスチャー（まばたき、口の開閉、眉の上下、頭の傾き）を認識する。
 """
 
+import math
+import os
 import cv2
-import mediapipe as mp
 import numpy as np
 from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional, Tuple, Dict, Any
 from enum import Enum, auto
 import time
+import queue
+import threading
 import yaml
 import argparse
 from pathlib import Path
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    # libyamlがない環境では純Python版を使う
+    from yaml import SafeLoader as _YamlLoader
+
 
 class GestureType(Enum):
     """ジェスチャーの種類"""
@@ -58,6 +67,23 @@ class GestureState:
     detected_gesture: GestureType = GestureType.NONE
 
 
+# 読み込んだYAMLのキャッシュ（パス -> (更新時刻, 内容)）
+_yaml_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def _load_yaml_cached(filepath: str) -> Dict[str, Any]:
+    """YAMLファイルを読み込む（更新時刻が変わっていなければ前回の内容を返す）"""
+    mtime = os.stat(filepath).st_mtime_ns
+    cached = _yaml_cache.get(filepath)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(filepath, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+    _yaml_cache[filepath] = (mtime, config)
+    return config
+
+
 @dataclass
 class Thresholds:
     """検出閾値"""
@@ -83,11 +109,15 @@ class Thresholds:
     # ジェスチャー確定
     gesture_cooldown: float = 0.5
 
+    # 処理
+    detect_width: int = 320  # Face Meshに渡す画像の最大幅（0で縮小しない）
+    detect_every: int = 1    # Face Meshを実行する間隔（フレーム数、1で毎フレーム）
+    refine_landmarks: bool = True  # 目・唇のランドマークを精緻化するか
+
     @classmethod
     def from_yaml(cls, filepath: str) -> 'Thresholds':
         """YAMLファイルから閾値を読み込む"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml_cached(filepath)
 
         return cls(
             eye_ar_threshold=config['eye']['aspect_ratio_threshold'],
@@ -102,6 +132,9 @@ class Thresholds:
             head_tilt_deadzone=config['head_tilt'].get('deadzone', 7.0),
             head_tilt_confirm_frames=config['head_tilt']['confirm_frames'],
             gesture_cooldown=config['gesture']['cooldown'],
+            detect_width=config.get('processing', {}).get('detect_width', 320),
+            detect_every=config.get('processing', {}).get('detect_every', 1),
+            refine_landmarks=config.get('processing', {}).get('refine_landmarks', True),
         )
 
 
@@ -135,8 +168,82 @@ class FaceLandmarks:
     CHIN = 152
 
 
+def _compute_features(pts):
+    """
+    ランドマーク座標から各特徴量を計算
+
+    Args:
+        pts: GestureDetector._NEEDED_IDX の順に並んだ (x, y) 座標
+
+    Returns:
+        (右目EAR, 左目EAR, 口の縦横比, 眉の位置, 鼻先-顎のx差, 鼻先-顎のy差) のタプル
+    """
+    # 目の縦横比（EAR）: 上・下・左・右
+    vertical = math.hypot(pts[0][0] - pts[1][0], pts[0][1] - pts[1][1])
+    horizontal = math.hypot(pts[2][0] - pts[3][0], pts[2][1] - pts[3][1])
+    right_ear = vertical / horizontal if horizontal > 0 else 0.0
+
+    vertical = math.hypot(pts[4][0] - pts[5][0], pts[4][1] - pts[5][1])
+    horizontal = math.hypot(pts[6][0] - pts[7][0], pts[6][1] - pts[7][1])
+    left_ear = vertical / horizontal if horizontal > 0 else 0.0
+
+    # 口の縦横比: 上・下・左・右
+    vertical = math.hypot(pts[8][0] - pts[9][0], pts[8][1] - pts[9][1])
+    horizontal = math.hypot(pts[10][0] - pts[11][0], pts[10][1] - pts[11][1])
+    mouth_ar = vertical / horizontal if horizontal > 0 else 0.0
+
+    # 眉の位置: 右眉・左眉・額
+    avg_eyebrow = (pts[12][1] + pts[13][1]) / 2
+    eyebrow_pos = pts[14][1] - avg_eyebrow
+
+    # 頭の傾き: 鼻先から顎へのベクトル（角度への変換は呼び出し側で行う）
+    tilt_dx = pts[15][0] - pts[16][0]
+    tilt_dy = pts[15][1] - pts[16][1]
+
+    return right_ear, left_ear, mouth_ar, eyebrow_pos, tilt_dx, tilt_dy
+
+
+# 検出器が使う特徴量計算関数（最初の検出器を作る時に決める）
+_features_impl: Optional[Tuple[Any, bool]] = None
+
+
+def _load_compute_features() -> Tuple[Any, bool]:
+    """
+    特徴量計算関数を取得
+
+    numba（llvmliteを含む）の読み込みは重いため、モジュール読み込み時ではなく
+    最初の検出器を作る時まで遅らせる。numbaがなければPython版をそのまま使う。
+
+    Returns:
+        (関数, numpy配列をそのまま渡すか) のタプル
+    """
+    global _features_impl
+    if _features_impl is None:
+        try:
+            from numba import njit
+        except ImportError:
+            # numbaは任意（未インストール時は通常のPython関数として実行し、リストで渡す方が速い）
+            _features_impl = (_compute_features, False)
+        else:
+            _features_impl = (njit(cache=True)(_compute_features), True)
+    return _features_impl
+
+
 class GestureDetector:
     """顔ジェスチャー検出クラス"""
+
+    # フレームごとに取り出すランドマーク（並び順は _compute_features と対応）
+    _NEEDED_IDX = (
+        FaceLandmarks.RIGHT_EYE_TOP, FaceLandmarks.RIGHT_EYE_BOTTOM,
+        FaceLandmarks.RIGHT_EYE_LEFT, FaceLandmarks.RIGHT_EYE_RIGHT,
+        FaceLandmarks.LEFT_EYE_TOP, FaceLandmarks.LEFT_EYE_BOTTOM,
+        FaceLandmarks.LEFT_EYE_LEFT, FaceLandmarks.LEFT_EYE_RIGHT,
+        FaceLandmarks.MOUTH_TOP, FaceLandmarks.MOUTH_BOTTOM,
+        FaceLandmarks.MOUTH_LEFT, FaceLandmarks.MOUTH_RIGHT,
+        FaceLandmarks.RIGHT_EYEBROW, FaceLandmarks.LEFT_EYEBROW,
+        FaceLandmarks.FOREHEAD_CENTER,
+        FaceLandmarks.NOSE_TIP, FaceLandmarks.CHIN,
+    )
     
     def __init__(self, thresholds: Optional[Thresholds] = None):
         """
@@ -146,22 +253,51 @@ class GestureDetector:
             thresholds: 検出閾値（Noneの場合はデフォルト値を使用）
         """
         self.thresholds = thresholds or Thresholds()
+        self._recompute_derived()
         
         # MediaPipe Face Mesh初期化
+        # mediapipeの読み込みは重いため、検出器を作る時まで遅らせる
+        import mediapipe as mp
         self.mp_face_mesh = mp.solutions.face_mesh
+        # 精緻化は虹彩だけでなく目・唇の輪郭（EAR・口の縦横比に使う点）も補正するため、
+        # 無効にする場合は目・口の閾値を調整し直す必要がある
         self.face_mesh = self.mp_face_mesh.FaceMesh(
             max_num_faces=1,
-            refine_landmarks=True,
+            refine_landmarks=self.thresholds.refine_landmarks,
             min_detection_confidence=0.5,
             min_tracking_confidence=0.5
         )
         
-        # 状態履歴
-        self.eye_closed_history = deque(maxlen=self.thresholds.long_close_frames)
-        self.mouth_open_history = deque(maxlen=self.thresholds.mouth_confirm_frames)
-        self.eyebrow_raised_history = deque(maxlen=self.thresholds.eyebrow_confirm_frames)
-        self.head_tilt_left_history = deque(maxlen=self.thresholds.head_tilt_confirm_frames)
-        self.head_tilt_right_history = deque(maxlen=self.thresholds.head_tilt_confirm_frames)
+        # 必要なランドマーク座標 (x, y) のバッファ
+        self._pts = np.zeros((len(self._NEEDED_IDX), 2), np.float32)
+
+        # numba使用時はここでJITコンパイルを済ませ、最初のフレームで待たせない
+        self._compute_features, self._features_take_array = _load_compute_features()
+        if self._features_take_array:
+            self._compute_features(self._pts)
+
+        # ランドマークの使い回し用
+        self._frame_idx = 0
+        self._last_results = None
+
+        # detect() が返す状態（毎フレーム使い回す）
+        self._state = GestureState()
+
+        # 前処理の出力バッファ（フレームサイズが変わった時のみ確保し直す）
+        self._small: Optional[np.ndarray] = None
+        self._rgb: Optional[np.ndarray] = None
+
+        # BGR→RGBをコピーせず、チャンネルを逆順にしたビューで渡す
+        # （MediaPipeが受け付けなかった場合はcvtColorに切り替える）
+        self._use_channel_view = True
+
+        # 状態の連続フレーム数
+        self.eye_closed_streak = 0
+        self.mouth_open_streak = 0
+        self.eyebrow_raised_streak = 0
+        self.head_tilt_left_streak = 0
+        self.head_tilt_right_streak = 0
+        self._prev_eyes_closed = False
         
         # まばたき検出用
         self.last_blink_time = 0.0
@@ -169,6 +305,7 @@ class GestureDetector:
 
         # 眉のベースライン検出用（移動平均）
         self.eyebrow_baseline_history = deque(maxlen=30)  # 約1秒分のベースライン
+        self._eyebrow_sum = 0.0  # eyebrow_baseline_history の合計
         self.eyebrow_baseline = None
 
         # ジェスチャークールダウン
@@ -180,69 +317,63 @@ class GestureDetector:
         # コールバック
         self.on_gesture_detected = None
     
-    def _calculate_eye_aspect_ratio(
-        self, 
-        landmarks, 
-        top: int, 
-        bottom: int, 
-        left: int, 
-        right: int
-    ) -> float:
-        """目の縦横比（EAR）を計算"""
-        vertical = np.linalg.norm(
-            np.array([landmarks[top].x, landmarks[top].y]) -
-            np.array([landmarks[bottom].x, landmarks[bottom].y])
-        )
-        horizontal = np.linalg.norm(
-            np.array([landmarks[left].x, landmarks[left].y]) -
-            np.array([landmarks[right].x, landmarks[right].y])
-        )
-        return vertical / horizontal if horizontal > 0 else 0
-    
-    def _calculate_mouth_aspect_ratio(self, landmarks) -> float:
-        """口の縦横比を計算"""
-        lm = FaceLandmarks
-        vertical = np.linalg.norm(
-            np.array([landmarks[lm.MOUTH_TOP].x, landmarks[lm.MOUTH_TOP].y]) -
-            np.array([landmarks[lm.MOUTH_BOTTOM].x, landmarks[lm.MOUTH_BOTTOM].y])
-        )
-        horizontal = np.linalg.norm(
-            np.array([landmarks[lm.MOUTH_LEFT].x, landmarks[lm.MOUTH_LEFT].y]) -
-            np.array([landmarks[lm.MOUTH_RIGHT].x, landmarks[lm.MOUTH_RIGHT].y])
-        )
-        return vertical / horizontal if horizontal > 0 else 0
-    
-    def _calculate_eyebrow_position(self, landmarks) -> float:
-        """眉の位置（上げ下げ）を計算"""
-        lm = FaceLandmarks
-        right_eyebrow_y = landmarks[lm.RIGHT_EYEBROW].y
-        left_eyebrow_y = landmarks[lm.LEFT_EYEBROW].y
-        forehead_y = landmarks[lm.FOREHEAD_CENTER].y
-        
-        avg_eyebrow = (right_eyebrow_y + left_eyebrow_y) / 2
-        return forehead_y - avg_eyebrow
-    
-    def _calculate_head_tilt(self, landmarks) -> float:
-        """頭の傾き角度を計算"""
-        lm = FaceLandmarks
-        nose = np.array([landmarks[lm.NOSE_TIP].x, landmarks[lm.NOSE_TIP].y])
-        chin = np.array([landmarks[lm.CHIN].x, landmarks[lm.CHIN].y])
+    def _recompute_derived(self) -> None:
+        """
+        閾値から毎フレーム使う値を計算してキャッシュ
         
-        diff = nose - chin
-        angle = np.degrees(np.arctan2(diff[0], diff[1]))
-        return angle
+        detect() 内で self.thresholds の属性を毎回参照しないようにする。
+        閾値を変更した場合は update_thresholds() を経由すること。
+        """
+        t = self.thresholds
+        self._eye_ar_threshold = float(t.eye_ar_threshold)
+        self._double_blink_interval = float(t.double_blink_interval)
+        self._mouth_ar_threshold = float(t.mouth_ar_threshold)
+        self._eyebrow_raise_threshold = float(t.eyebrow_raise_threshold)
+        self._gesture_cooldown = float(t.gesture_cooldown)
+        self._detect_width = int(t.detect_width)
+        self._detect_every = int(t.detect_every)
+        # 頭の傾き判定に使う角度の境界（|angle| がこれより大きければ正面）
+        self._center_cutoff = 180.0 - float(t.head_tilt_deadzone)
+        self._eyebrow_cutoff = 180.0 - float(t.head_tilt_threshold)
+        # 連続フレーム数で確定するジェスチャーの表
+        # (連続フレーム数の属性名, 必要フレーム数, ジェスチャー, 定常状態に戻るまで再検出しないか)
+        self._confirm_table = (
+            ('eye_closed_streak', int(t.long_close_frames), GestureType.LONG_CLOSE, False),
+            ('mouth_open_streak', int(t.mouth_confirm_frames), GestureType.MOUTH_OPEN, True),
+            ('eyebrow_raised_streak', int(t.eyebrow_confirm_frames), GestureType.EYEBROWS_RAISED, True),
+            ('head_tilt_left_streak', int(t.head_tilt_confirm_frames), GestureType.HEAD_TILT_LEFT, True),
+            ('head_tilt_right_streak', int(t.head_tilt_confirm_frames), GestureType.HEAD_TILT_RIGHT, True),
+        )
     
-    def _is_gesture_available(self, gesture_type: GestureType) -> bool:
-        """ジェスチャーがクールダウン中でないか確認"""
+    @staticmethod
+    def _reuse_buffer(buffer: Optional[np.ndarray], shape: Tuple[int, ...]) -> np.ndarray:
+        """形状が一致すれば既存バッファを、しなければ新しいバッファを返す"""
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, np.uint8)
+        return buffer
+    
+    def _extract_points(self, landmarks) -> np.ndarray:
+        """必要なランドマーク座標をバッファにまとめて取り出す"""
+        pts = self._pts
+        for k, i in enumerate(self._NEEDED_IDX):
+            point = landmarks[i]
+            pts[k, 0] = point.x
+            pts[k, 1] = point.y
+        return pts
+    
+    def _is_gesture_available(self, gesture_type: GestureType, now: Optional[float] = None) -> bool:
+        """ジェスチャーがクールダウン中でないか確認（now: 現在時刻、省略時は取得する）"""
         if gesture_type not in self.last_gesture_time:
             return True
         
-        elapsed = time.time() - self.last_gesture_time[gesture_type]
-        return elapsed >= self.thresholds.gesture_cooldown
-    
-    def _confirm_gesture(self, gesture_type: GestureType) -> None:
-        """ジェスチャーを確定"""
-        self.last_gesture_time[gesture_type] = time.time()
+        if now is None:
+            now = time.time()
+        elapsed = now - self.last_gesture_time[gesture_type]
+        return elapsed >= self._gesture_cooldown
+    
+    def _confirm_gesture(self, gesture_type: GestureType, now: Optional[float] = None) -> None:
+        """ジェスチャーを確定（now: 現在時刻、省略時は取得する）"""
+        self.last_gesture_time[gesture_type] = time.time() if now is None else now
         self.gesture_confirmed[gesture_type] = True
 
         if self.on_gesture_detected:
@@ -256,6 +387,29 @@ class GestureDetector:
         """ジェスチャーの確定フラグをリセット（定常状態に戻った時に呼ぶ）"""
         self.gesture_confirmed[gesture_type] = False
     
+    def _run_face_mesh(self, frame: np.ndarray) -> Any:
+        """前処理を行ってFace Meshを実行"""
+        # ランドマーク座標は正規化済みのため、縮小しても後段の計算は変わらない
+        height, width = frame.shape[:2]
+        detect_width = self._detect_width
+        if 0 < detect_width < width:
+            detect_height = round(height * detect_width / width)
+            self._small = self._reuse_buffer(self._small, (detect_height, detect_width, 3))
+            frame = cv2.resize(frame, (detect_width, detect_height),
+                               dst=self._small, interpolation=cv2.INTER_AREA)
+
+        results = None
+        if self._use_channel_view:
+            try:
+                results = self.face_mesh.process(frame[:, :, ::-1])
+            except (TypeError, ValueError):
+                self._use_channel_view = False
+        if not self._use_channel_view:
+            self._rgb = self._reuse_buffer(self._rgb, frame.shape)
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb)
+            results = self.face_mesh.process(rgb_frame)
+        return results
+    
     def detect(self, frame: np.ndarray) -> Tuple[GestureState, Any]:
         """
         フレームからジェスチャーを検出
@@ -265,27 +419,53 @@ class GestureDetector:
             
         Returns:
             (GestureState, MediaPipe結果) のタプル
+            GestureStateは検出器が使い回すため、次のdetect()呼び出しまでに読み取ること
         """
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.face_mesh.process(rgb_frame)
+        # Face Meshは detect_every フレームに1回だけ実行し、間のフレームは前回の
+        # ランドマークを使い回す（顔が見つかっていない間は毎フレーム実行）
+        last = self._last_results
+        detect_every = self._detect_every
+        run_face_mesh = (
+            detect_every <= 1 or
+            last is None or
+            not last.multi_face_landmarks or
+            self._frame_idx % detect_every == 0
+        )
+        self._frame_idx += 1
+        if run_face_mesh:
+            results = self._run_face_mesh(frame)
+            self._last_results = results
+        else:
+            results = last
         
-        state = GestureState()
+        # 状態オブジェクトは毎フレーム作らず、既定値に戻して使い回す
+        state = self._state
+        state.face_detected = False
+        state.eyes_closed = False
+        state.left_eye_ar = 0.0
+        state.right_eye_ar = 0.0
+        state.mouth_open = False
+        state.mouth_ar = 0.0
+        state.eyebrows_raised = False
+        state.eyebrow_position = 0.0
+        state.head_tilt_angle = 0.0
+        state.head_tilt_left = False
+        state.head_tilt_right = False
+        state.head_tilt_center = True
+        state.detected_gesture = GestureType.NONE
         
         if not results.multi_face_landmarks:
             return state, results
 
-        landmarks = results.multi_face_landmarks[0].landmark
         state.face_detected = True
-        lm = FaceLandmarks
-        
-        # 目の縦横比を計算
-        right_ear = self._calculate_eye_aspect_ratio(
-            landmarks, lm.RIGHT_EYE_TOP, lm.RIGHT_EYE_BOTTOM,
-            lm.RIGHT_EYE_LEFT, lm.RIGHT_EYE_RIGHT
-        )
-        left_ear = self._calculate_eye_aspect_ratio(
-            landmarks, lm.LEFT_EYE_TOP, lm.LEFT_EYE_BOTTOM,
-            lm.LEFT_EYE_LEFT, lm.LEFT_EYE_RIGHT
+        if run_face_mesh:
+            self._extract_points(results.multi_face_landmarks[0].landmark)
+        pts = self._pts
+        current_time = time.time()
+
+        # 特徴量を一括で計算
+        right_ear, left_ear, mouth_ar, eyebrow_pos, tilt_dx, tilt_dy = self._compute_features(
+            pts if self._features_take_array else pts.tolist()
         )
         
         state.right_eye_ar = right_ear
@@ -293,71 +473,53 @@ class GestureDetector:
         avg_ear = (right_ear + left_ear) / 2
         
         # 目の開閉判定
-        eyes_closed = avg_ear < self.thresholds.eye_ar_threshold
+        eyes_closed = avg_ear < self._eye_ar_threshold
         state.eyes_closed = eyes_closed
 
-        # 履歴更新
-        self.eye_closed_history.append(eyes_closed)
-
-        current_time = time.time()
+        # 連続フレーム数を更新
+        self.eye_closed_streak = self.eye_closed_streak + 1 if eyes_closed else 0
+        was_closed = self._prev_eyes_closed
+        self._prev_eyes_closed = eyes_closed
 
         # まばたき検出（閉→開のエッジ検出）
         # 前回閉じていて今回開いたらまばたき完了
-        if len(self.eye_closed_history) >= 2:
-            was_closed = self.eye_closed_history[-2]
-            is_open = not eyes_closed
-            if was_closed and is_open:
-                # クールダウン中は新しいまばたきカウントを開始しない
-                if not self._is_gesture_available(GestureType.DOUBLE_BLINK):
-                    # クールダウン中：まばたきカウントをリセット状態に保つ
-                    self.blink_count = 0
-                    self.last_blink_time = 0
+        if was_closed and not eyes_closed:
+            # クールダウン中は新しいまばたきカウントを開始しない
+            if not self._is_gesture_available(GestureType.DOUBLE_BLINK, current_time):
+                # クールダウン中：まばたきカウントをリセット状態に保つ
+                self.blink_count = 0
+                self.last_blink_time = 0
+            else:
+                # まばたき検出
+                time_since_last = current_time - self.last_blink_time
+                if time_since_last < self._double_blink_interval and self.blink_count >= 1:
+                    # 2回目のまばたき（前回から0.8秒以内）
+                    self.blink_count += 1
+                    if self.blink_count >= 2:
+                        state.detected_gesture = GestureType.DOUBLE_BLINK
+                        self._confirm_gesture(GestureType.DOUBLE_BLINK, current_time)
+                        self.blink_count = 0
+                        self.last_blink_time = 0  # リセット
                 else:
-                    # まばたき検出
-                    time_since_last = current_time - self.last_blink_time
-                    if time_since_last < self.thresholds.double_blink_interval and self.blink_count >= 1:
-                        # 2回目のまばたき（前回から0.8秒以内）
-                        self.blink_count += 1
-                        if self.blink_count >= 2:
-                            state.detected_gesture = GestureType.DOUBLE_BLINK
-                            self._confirm_gesture(GestureType.DOUBLE_BLINK)
-                            self.blink_count = 0
-                            self.last_blink_time = 0  # リセット
-                    else:
-                        # 1回目のまばたき、またはタイムアウト後
-                        self.blink_count = 1
-                        self.last_blink_time = current_time
-        
-        # 長閉じ検出
-        if (len(self.eye_closed_history) == self.thresholds.long_close_frames and
-            all(self.eye_closed_history) and
-            self._is_gesture_available(GestureType.LONG_CLOSE)):
-            state.detected_gesture = GestureType.LONG_CLOSE
-            self._confirm_gesture(GestureType.LONG_CLOSE)
+                    # 1回目のまばたき、またはタイムアウト後
+                    self.blink_count = 1
+                    self.last_blink_time = current_time
         
         # 口の開閉
-        mouth_ar = self._calculate_mouth_aspect_ratio(landmarks)
         state.mouth_ar = mouth_ar
-        mouth_detected = mouth_ar > self.thresholds.mouth_ar_threshold
+        mouth_detected = mouth_ar > self._mouth_ar_threshold
         state.mouth_open = mouth_detected
 
         # 口が閉じたら確定フラグをリセット（再検出可能に）
         if not mouth_detected:
             self._reset_gesture_confirmed(GestureType.MOUTH_OPEN)
 
-        self.mouth_open_history.append(mouth_detected)
-        if (all(self.mouth_open_history) and
-            len(self.mouth_open_history) == self.thresholds.mouth_confirm_frames and
-            self._is_gesture_available(GestureType.MOUTH_OPEN) and
-            self._is_gesture_ready(GestureType.MOUTH_OPEN)):
-            state.detected_gesture = GestureType.MOUTH_OPEN
-            self._confirm_gesture(GestureType.MOUTH_OPEN)
+        self.mouth_open_streak = self.mouth_open_streak + 1 if mouth_detected else 0
 
-        # 頭の傾きを先に計算（眉検出の判定に使用）
-        head_tilt = self._calculate_head_tilt(landmarks)
+        # 頭の傾きを先に判定（眉検出の判定に使用）
+        # 角度は表示・送信に毎フレーム必要なため、判定もこの角度で行う
+        head_tilt = math.degrees(math.atan2(tilt_dx, tilt_dy))
         state.head_tilt_angle = head_tilt
-        deadzone = self.thresholds.head_tilt_deadzone
-        threshold = self.thresholds.head_tilt_threshold
 
         # 角度の解釈:
         # 正面を向いている時: ±180度付近（鼻が顎の真上）
@@ -367,40 +529,37 @@ class GestureDetector:
         # CENTER: |angle| > (180 - deadzone) つまり 173〜180 または -180〜-173
         # LEFT: -173〜0（負の値で不感帯外）
         # RIGHT: 0〜173（正の値で不感帯外）
-
-        is_head_centered = abs(head_tilt) > (180 - deadzone)  # 173〜180, -180〜-173がCENTER
+        abs_tilt = abs(head_tilt)
+        is_head_centered = abs_tilt > self._center_cutoff  # 173〜180, -180〜-173がCENTER
 
         # 眉の位置（移動平均からの相対変化で検出）
-        eyebrow_pos = self._calculate_eyebrow_position(landmarks)
         state.eyebrow_position = eyebrow_pos
 
         # 頭が大きく傾いている時は眉検出を無効にする（誤検出防止）
         # 閾値未満（|angle| > 160）なら眉検出を有効にする
-        is_head_centered_for_eyebrow = abs(head_tilt) > (180 - threshold)
+        is_head_centered_for_eyebrow = abs_tilt > self._eyebrow_cutoff
         eyebrows_detected = False
         if is_head_centered_for_eyebrow:
             # ベースラインからの上昇で判定
             if self.eyebrow_baseline is not None:
                 eyebrow_diff = eyebrow_pos - self.eyebrow_baseline
-                eyebrows_detected = eyebrow_diff > self.thresholds.eyebrow_raise_threshold
+                eyebrows_detected = eyebrow_diff > self._eyebrow_raise_threshold
 
             # ベースライン（移動平均）を更新（眉を上げていない時のみ）
             if not eyebrows_detected:
-                self.eyebrow_baseline_history.append(eyebrow_pos)
-                if len(self.eyebrow_baseline_history) >= 10:
-                    self.eyebrow_baseline = sum(self.eyebrow_baseline_history) / len(self.eyebrow_baseline_history)
+                history = self.eyebrow_baseline_history
+                if len(history) == history.maxlen:
+                    self._eyebrow_sum -= history[0]
+                history.append(eyebrow_pos)
+                self._eyebrow_sum += eyebrow_pos
+                if len(history) >= 10:
+                    self.eyebrow_baseline = self._eyebrow_sum / len(history)
                 # 眉が下がったら確定フラグをリセット
                 self._reset_gesture_confirmed(GestureType.EYEBROWS_RAISED)
 
         state.eyebrows_raised = eyebrows_detected
 
-        self.eyebrow_raised_history.append(eyebrows_detected)
-        if (all(self.eyebrow_raised_history) and
-            len(self.eyebrow_raised_history) == self.thresholds.eyebrow_confirm_frames and
-            self._is_gesture_available(GestureType.EYEBROWS_RAISED) and
-            self._is_gesture_ready(GestureType.EYEBROWS_RAISED)):
-            state.detected_gesture = GestureType.EYEBROWS_RAISED
-            self._confirm_gesture(GestureType.EYEBROWS_RAISED)
+        self.eyebrow_raised_streak = self.eyebrow_raised_streak + 1 if eyebrows_detected else 0
 
         # 頭の傾き判定
         if is_head_centered:
@@ -414,48 +573,47 @@ class GestureDetector:
             # 不感帯外
             state.head_tilt_center = False
             # LEFT: 負の値で不感帯外（-173〜0）、閾値超えで確定
-            left_detected = head_tilt < 0 and head_tilt > -(180 - deadzone)
+            left_detected = head_tilt < 0
             state.head_tilt_left = left_detected
             # RIGHT: 正の値で不感帯外（0〜173）、閾値超えで確定
-            right_detected = head_tilt > 0 and head_tilt < (180 - deadzone)
+            right_detected = head_tilt > 0
             state.head_tilt_right = right_detected
 
-        self.head_tilt_left_history.append(state.head_tilt_left)
-        self.head_tilt_right_history.append(state.head_tilt_right)
-
-        if (all(self.head_tilt_left_history) and
-            len(self.head_tilt_left_history) == self.thresholds.head_tilt_confirm_frames and
-            self._is_gesture_available(GestureType.HEAD_TILT_LEFT) and
-            self._is_gesture_ready(GestureType.HEAD_TILT_LEFT)):
-            state.detected_gesture = GestureType.HEAD_TILT_LEFT
-            self._confirm_gesture(GestureType.HEAD_TILT_LEFT)
-
-        if (all(self.head_tilt_right_history) and
-            len(self.head_tilt_right_history) == self.thresholds.head_tilt_confirm_frames and
-            self._is_gesture_available(GestureType.HEAD_TILT_RIGHT) and
-            self._is_gesture_ready(GestureType.HEAD_TILT_RIGHT)):
-            state.detected_gesture = GestureType.HEAD_TILT_RIGHT
-            self._confirm_gesture(GestureType.HEAD_TILT_RIGHT)
+        self.head_tilt_left_streak = self.head_tilt_left_streak + 1 if state.head_tilt_left else 0
+        self.head_tilt_right_streak = self.head_tilt_right_streak + 1 if state.head_tilt_right else 0
+
+        # 連続フレーム数が必要数に達したジェスチャーを確定（複数の場合は表の後の方が優先）
+        for streak_attr, required_frames, gesture_type, needs_ready in self._confirm_table:
+            if (getattr(self, streak_attr) >= required_frames and
+                self._is_gesture_available(gesture_type, current_time) and
+                (not needs_ready or self._is_gesture_ready(gesture_type))):
+                state.detected_gesture = gesture_type
+                self._confirm_gesture(gesture_type, current_time)
         
         return state, results
     
     def reset(self) -> None:
         """状態をリセット"""
-        self.eye_closed_history.clear()
-        self.mouth_open_history.clear()
-        self.eyebrow_raised_history.clear()
-        self.head_tilt_left_history.clear()
-        self.head_tilt_right_history.clear()
+        self.eye_closed_streak = 0
+        self.mouth_open_streak = 0
+        self.eyebrow_raised_streak = 0
+        self.head_tilt_left_streak = 0
+        self.head_tilt_right_streak = 0
+        self._prev_eyes_closed = False
         self.last_blink_time = 0.0
         self.blink_count = 0
         self.eyebrow_baseline_history.clear()
+        self._eyebrow_sum = 0.0
         self.eyebrow_baseline = None
         self.last_gesture_time.clear()
         self.gesture_confirmed.clear()
+        self._frame_idx = 0
+        self._last_results = None
     
     def update_thresholds(self, thresholds: Thresholds) -> None:
         """閾値を更新"""
         self.thresholds = thresholds
+        self._recompute_derived()
     
     def close(self) -> None:
         """リソースを解放"""
@@ -465,15 +623,72 @@ class GestureDetector:
 class DebugVisualizer:
     """デバッグ用の可視化クラス"""
     
-    def __init__(self):
+    _FONT = cv2.FONT_HERSHEY_SIMPLEX
+    _X = 10
+    _Y0 = 30
+    _LINE_HEIGHT = 25
+    
+    # ステータス表示の固定ラベル（ラベル, 文字サイズ, 太さ）。1行目以外は顔検出時のみ表示
+    _LABELS = (
+        ("Face: ", 0.6, 2),
+        ("Eye AR: ", 0.5, 1),
+        ("Eyes: ", 0.6, 2),
+        ("Mouth AR: ", 0.5, 1),
+        ("Mouth: ", 0.6, 2),
+        ("Eyebrows: ", 0.6, 2),
+        ("Head Tilt: ", 0.6, 2),
+    )
+    
+    _GESTURE_NAMES = {
+        GestureType.DOUBLE_BLINK: ">>> DOUBLE BLINK (YES) <<<",
+        GestureType.LONG_CLOSE: ">>> LONG CLOSE (NO) <<<",
+        GestureType.EYEBROWS_RAISED: ">>> EYEBROWS RAISED (MENU) <<<",
+        GestureType.MOUTH_OPEN: ">>> MOUTH OPEN (SELECT) <<<",
+        GestureType.HEAD_TILT_LEFT: ">>> HEAD TILT LEFT (PREV) <<<",
+        GestureType.HEAD_TILT_RIGHT: ">>> HEAD TILT RIGHT (NEXT) <<<",
+    }
+    
+    def __init__(self, draw_mesh: bool = False):
+        """
+        初期化
+        
+        Args:
+            draw_mesh: 顔の輪郭（ランドマーク）も描画するか（描画負荷が大きい）
+        """
+        import mediapipe as mp
+        
+        self.draw_mesh = draw_mesh
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
         self.mp_face_mesh = mp.solutions.face_mesh
+        
+        # 固定ラベルは一度だけ描画しておき、毎フレーム合成する
+        widths = [
+            cv2.getTextSize(label, self._FONT, scale, thickness)[0][0]
+            for label, scale, thickness in self._LABELS
+        ]
+        layer_height = self._Y0 + self._LINE_HEIGHT * (len(self._LABELS) - 1) + 10
+        self._label_layer = np.zeros((layer_height, self._X + max(widths), 3), np.uint8)
+        for i, (label, scale, thickness) in enumerate(self._LABELS):
+            cv2.putText(self._label_layer, label, (self._X, self._y(i)),
+                        self._FONT, scale, (255, 255, 255), thickness)
+        self._value_x = [self._X + width for width in widths]
+        self._face_only_height = self._Y0 + 10
+    
+    def _y(self, row: int) -> int:
+        """ステータス表示の行のy座標"""
+        return self._Y0 + self._LINE_HEIGHT * row
+    
+    def _put_value(self, frame: np.ndarray, row: int, text: str, color: Tuple[int, int, int]) -> None:
+        """ラベルの右に値を描画"""
+        _, scale, thickness = self._LABELS[row]
+        cv2.putText(frame, text, (self._value_x[row], self._y(row)),
+                    self._FONT, scale, color, thickness)
     
     def draw(self, frame: np.ndarray, state: GestureState, results: Any) -> np.ndarray:
         """デバッグ情報を描画"""
         # 顔のランドマークを描画
-        if results.multi_face_landmarks:
+        if self.draw_mesh and results.multi_face_landmarks:
             self.mp_drawing.draw_landmarks(
                 frame,
                 results.multi_face_landmarks[0],
@@ -482,41 +697,36 @@ class DebugVisualizer:
                 connection_drawing_spec=self.mp_drawing_styles.get_default_face_mesh_contours_style()
             )
         
+        # 固定ラベルを合成（白文字なので飽和加算で上書きと同じになる）
+        height = self._label_layer.shape[0] if state.face_detected else self._face_only_height
+        height = min(height, frame.shape[0])
+        width = min(self._label_layer.shape[1], frame.shape[1])
+        roi = frame[:height, :width]
+        cv2.add(roi, self._label_layer[:height, :width], dst=roi)
+        
         # ステータス表示
-        y_offset = 30
         status_color = (0, 255, 0) if state.face_detected else (0, 0, 255)
-        
-        cv2.putText(frame, f"Face: {'Detected' if state.face_detected else 'Not Found'}", 
-                    (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.6, status_color, 2)
+        self._put_value(frame, 0, 'Detected' if state.face_detected else 'Not Found', status_color)
         
         if state.face_detected:
-            y_offset += 25
-            cv2.putText(frame, f"Eye AR: L={state.left_eye_ar:.2f} R={state.right_eye_ar:.2f}", 
-                        (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+            self._put_value(frame, 1, f"L={state.left_eye_ar:.2f} R={state.right_eye_ar:.2f}",
+                            (255, 255, 255))
             
-            y_offset += 25
             eye_status = "CLOSED" if state.eyes_closed else "Open"
             eye_color = (0, 0, 255) if state.eyes_closed else (0, 255, 0)
-            cv2.putText(frame, f"Eyes: {eye_status}", 
-                        (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.6, eye_color, 2)
+            self._put_value(frame, 2, eye_status, eye_color)
             
-            y_offset += 25
-            cv2.putText(frame, f"Mouth AR: {state.mouth_ar:.2f}", 
-                        (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+            self._put_value(frame, 3, f"{state.mouth_ar:.2f}", (255, 255, 255))
             
-            y_offset += 25
             mouth_status = "OPEN" if state.mouth_open else "Closed"
             mouth_color = (0, 255, 255) if state.mouth_open else (255, 255, 255)
-            cv2.putText(frame, f"Mouth: {mouth_status}", 
-                        (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.6, mouth_color, 2)
+            self._put_value(frame, 4, mouth_status, mouth_color)
             
-            y_offset += 25
             eyebrow_status = "RAISED" if state.eyebrows_raised else "Normal"
             eyebrow_color = (255, 0, 255) if state.eyebrows_raised else (255, 255, 255)
-            cv2.putText(frame, f"Eyebrows: {eyebrow_status} ({state.eyebrow_position:.4f})",
-                        (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.6, eyebrow_color, 2)
+            self._put_value(frame, 5, f"{eyebrow_status} ({state.eyebrow_position:.4f})",
+                            eyebrow_color)
             
-            y_offset += 25
             # 角度範囲: CENTER(173〜180, -180〜-173), LEFT(-173〜0), RIGHT(0〜173)
             if state.head_tilt_center:
                 tilt_status = "CENTER"
@@ -530,30 +740,74 @@ class DebugVisualizer:
             else:
                 tilt_status = "---"  # 不感帯外だが閾値未満
                 tilt_color = (255, 255, 255)
-            cv2.putText(frame, f"Head Tilt: {tilt_status} ({state.head_tilt_angle:.1f})",
-                        (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.6, tilt_color, 2)
+            self._put_value(frame, 6, f"{tilt_status} ({state.head_tilt_angle:.1f})", tilt_color)
             
             # ジェスチャーイベント表示
             if state.detected_gesture != GestureType.NONE:
-                y_offset += 40
-                gesture_names = {
-                    GestureType.DOUBLE_BLINK: ">>> DOUBLE BLINK (YES) <<<",
-                    GestureType.LONG_CLOSE: ">>> LONG CLOSE (NO) <<<",
-                    GestureType.EYEBROWS_RAISED: ">>> EYEBROWS RAISED (MENU) <<<",
-                    GestureType.MOUTH_OPEN: ">>> MOUTH OPEN (SELECT) <<<",
-                    GestureType.HEAD_TILT_LEFT: ">>> HEAD TILT LEFT (PREV) <<<",
-                    GestureType.HEAD_TILT_RIGHT: ">>> HEAD TILT RIGHT (NEXT) <<<",
-                }
-                cv2.putText(frame, gesture_names.get(state.detected_gesture, ""), 
-                            (10, y_offset), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+                y_offset = self._y(len(self._LABELS) - 1) + 40
+                cv2.putText(frame, self._GESTURE_NAMES.get(state.detected_gesture, ""), 
+                            (self._X, y_offset), self._FONT, 0.7, (0, 255, 0), 2)
         
         return frame
 
 
+class LatestFrameReader:
+    """カメラからの読み込みを別スレッドで行い、最新のフレームだけを保持するクラス"""
+    
+    def __init__(self, cap: cv2.VideoCapture):
+        """
+        初期化
+        
+        Args:
+            cap: 読み込み元のカメラ
+        """
+        self.cap = cap
+        self._frames: queue.Queue = queue.Queue(maxsize=1)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    def _put_latest(self, frame: Optional[np.ndarray]) -> None:
+        """古いフレームを捨てて最新のフレームを置く"""
+        try:
+            self._frames.get_nowait()
+        except queue.Empty:
+            pass
+        self._frames.put_nowait(frame)
+    
+    def _run(self) -> None:
+        """読み込みスレッド（取得失敗時はNoneを置いて終了）"""
+        while not self._stopped.is_set():
+            ret, frame = self.cap.read()
+            if not ret:
+                self._put_latest(None)
+                break
+            self._put_latest(frame)
+    
+    def start(self) -> 'LatestFrameReader':
+        """読み込みを開始"""
+        self._thread.start()
+        return self
+    
+    def read(self, timeout: float = 5.0) -> Tuple[bool, Optional[np.ndarray]]:
+        """最新のフレームを取得（cv2.VideoCapture.read と同じ形式）"""
+        try:
+            frame = self._frames.get(timeout=timeout)
+        except queue.Empty:
+            return False, None
+        return frame is not None, frame
+    
+    def stop(self) -> None:
+        """読み込みを停止"""
+        self._stopped.set()
+        self._thread.join(timeout=1.0)
+
+
 def main():
     """デバッグ用メイン関数"""
     parser = argparse.ArgumentParser(description='顔ジェスチャー検出テスト')
     parser.add_argument('--debug', action='store_true', help='デバッグモードで実行')
+    parser.add_argument('--verbose', action='store_true',
+                        help='デバッグ表示で顔の輪郭（ランドマーク）も描画')
     parser.add_argument('--config', type=str, default='config/thresholds.yaml', 
                         help='閾値設定ファイルのパス')
     parser.add_argument('--camera', type=int, default=0, help='カメラデバイスID')
@@ -574,9 +828,14 @@ def main():
     
     # カメラ初期化
     cap = cv2.VideoCapture(args.camera)
+    # MJPEGで受け取り、YUYV→BGRのソフトウェア変換と転送量を減らす
+    # （解像度より先に設定しないと反映されないドライバがある）
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
     cap.set(cv2.CAP_PROP_FPS, 30)
+    # 古いフレームを溜め込まない
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
     
     if not cap.isOpened():
         print("エラー: カメラを開けませんでした")
@@ -584,7 +843,7 @@ def main():
     
     # 検出器と可視化クラスの初期化
     detector = GestureDetector(thresholds)
-    visualizer = DebugVisualizer() if args.debug else None
+    visualizer = DebugVisualizer(draw_mesh=args.verbose) if args.debug else None
     
     # ジェスチャー検出時のコールバック
     def on_gesture(gesture_type: GestureType):
@@ -600,19 +859,25 @@ def main():
     
     detector.on_gesture_detected = on_gesture
     
+    # カメラの読み込みを推論と並行して行う
+    reader = LatestFrameReader(cap).start()
+    
     print("カメラ起動完了")
     print("顔をカメラに向けてください")
     print("-" * 50)
     
+    mirrored = None
     try:
         while True:
-            ret, frame = cap.read()
+            ret, frame = reader.read()
             if not ret:
                 print("フレーム取得エラー")
                 break
             
-            # 左右反転（鏡像）
-            frame = cv2.flip(frame, 1)
+            # 左右反転（鏡像）。出力バッファは使い回す
+            if mirrored is None or mirrored.shape != frame.shape:
+                mirrored = np.empty_like(frame)
+            frame = cv2.flip(frame, 1, dst=mirrored)
             
             # ジェスチャー検出
             state, results = detector.detect(frame)
@@ -635,6 +900,7 @@ def main():
     except KeyboardInterrupt:
         print("\n中断されました")
     finally:
+        reader.stop()
         detector.close()
         cap.release()
         cv2.destroyAllWindows()
@@ -7,6 +7,7 @@
 
 import sys
 import signal
+import threading
 from pathlib import Path
 
 # プロジェクトルートをパスに追加
@@ -89,9 +90,9 @@ def main():
     print()
     
     # イベントループ（将来的にはGUIのイベントループに置き換え）
+    # シグナルを受けるまでCPUを使わずに待機する
     try:
-        while True:
-            pass
+        threading.Event().wait()
     except KeyboardInterrupt:
         pass
     finally:
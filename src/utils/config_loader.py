@@ -7,6 +7,13 @@ import yaml
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
+from functools import cached_property
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    # libyamlがない環境では純Python版を使う
+    from yaml import SafeLoader as _SafeLoader
 
 
 @dataclass
@@ -86,7 +93,7 @@ class ConfigLoader:
             return {}
         
         with open(filepath, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=_SafeLoader) or {}
     
     def _load_settings(self) -> None:
         """設定ファイルを読み込む"""
@@ -116,7 +123,8 @@ class ConfigLoader:
                     Phrase(id=p_data['id'], text=p_data['text'], short=p_data['short'])
                 )
     
-    @property
+    # 設定は初期化時に一度だけ読み込むため、各設定オブジェクトも初回アクセス時に一度だけ生成する
+    @cached_property
     def camera(self) -> CameraConfig:
         """カメラ設定を取得"""
         cam = self._settings.get('camera', {})
@@ -127,7 +135,7 @@ class ConfigLoader:
             fps=cam.get('fps', 30)
         )
     
-    @property
+    @cached_property
     def gui(self) -> GuiConfig:
         """GUI設定を取得"""
         gui = self._settings.get('gui', {})
@@ -139,7 +147,7 @@ class ConfigLoader:
             text_color=gui.get('text_color', '#FFFFFF')
         )
     
-    @property
+    @cached_property
     def audio(self) -> AudioConfig:
         """音声設定を取得"""
         audio = self._settings.get('audio', {})
@@ -150,7 +158,7 @@ class ConfigLoader:
             language=audio.get('language', 'ja')
         )
     
-    @property
+    @cached_property
     def audible(self) -> AudibleConfig:
         """Audible設定を取得"""
         audible = self._settings.get('audible', {})
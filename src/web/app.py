@@ -4,20 +4,52 @@ FastAPI Webアプリケーション
 顔ジェスチャーで操作するWebアプリのメインエントリーポイント
 """
 
+import os
+import sys
+import asyncio
+import numpy as np
+import orjson
 import uvicorn
+import yaml
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 from fastapi import FastAPI, WebSocket
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 
-from ..gesture_detector import Thresholds
+from ..gesture_detector import GestureDetector, Thresholds
 from .websocket_handler import GestureWebSocketHandler, websocket_endpoint
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    # libyamlがない環境では純Python版を使う
+    from yaml import SafeLoader as _SafeLoader
+
 
 # プロジェクトルートを取得
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 STATIC_DIR = PROJECT_ROOT / "static"
 CONFIG_DIR = PROJECT_ROOT / "config"
+PHRASES_PATH = CONFIG_DIR / "phrases.yaml"
+MELODIES_PATH = CONFIG_DIR / "melodies.yaml"
+
+
+def _detect_workers() -> int:
+    """
+    検出処理用スレッド数・検出器プールのサイズを環境変数から取得
+
+    想定する同時接続クライアント数（通常はベッドサイドの1台）
+    """
+    workers = int(os.getenv("FACE_COMM_DETECT_WORKERS", "1"))
+    if workers < 1:
+        raise ValueError(f"FACE_COMM_DETECT_WORKERS は1以上を指定してください: {workers}")
+    return workers
+
+
+DETECT_WORKERS = _detect_workers()
 
 
 # FastAPIアプリケーション
@@ -37,8 +69,58 @@ def load_thresholds() -> Thresholds:
     return Thresholds()
 
 
-# WebSocketハンドラを作成
-gesture_handler = GestureWebSocketHandler(load_thresholds())
+# 閾値は起動時に一度だけ読み込み、全接続で共有する（検出器は閾値を書き換えない）
+THRESHOLDS = load_thresholds()
+
+# 接続間で使い回す検出器のプール（起動時に作成）
+_detector_pool: Optional[asyncio.Queue] = None
+
+
+def _create_detector() -> GestureDetector:
+    """検出器を作成し、MediaPipeのグラフを事前に初期化する"""
+    detector = GestureDetector(THRESHOLDS)
+    detector.detect(np.zeros((240, 320, 3), np.uint8))
+    detector.reset()
+    return detector
+
+
+def _release_detector(detector: GestureDetector) -> None:
+    """検出器の状態をリセットしてプールに戻す（プールが満杯なら破棄）"""
+    detector.reset()
+    detector.on_gesture_detected = None
+    try:
+        _detector_pool.put_nowait(detector)
+    except asyncio.QueueFull:
+        detector.close()
+
+
+@app.on_event("startup")
+async def setup_executor():
+    """検出処理を実行するスレッドプールを設定"""
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=DETECT_WORKERS, thread_name_prefix="detect")
+    )
+
+
+@app.on_event("startup")
+async def setup_detector_pool():
+    """
+    検出器のプールを作成
+
+    MediaPipeのグラフ構築は重いため、想定する同時接続数分を起動時に
+    作成・初期化しておき、接続ごとに貸し出す
+    """
+    global _detector_pool
+    _detector_pool = asyncio.Queue(maxsize=DETECT_WORKERS)
+    for _ in range(DETECT_WORKERS):
+        _detector_pool.put_nowait(_create_detector())
+
+
+@app.on_event("shutdown")
+async def close_detector_pool():
+    """プール内の検出器を解放"""
+    while not _detector_pool.empty():
+        _detector_pool.get_nowait().close()
 
 
 # 静的ファイルをマウント
@@ -55,42 +137,71 @@ async def root():
     return {"message": "Face Gesture Communication API", "status": "running"}
 
 
-@app.get("/api/config")
-async def get_config():
-    """設定情報を返す"""
-    import yaml
+def _mtime(path: Path) -> int:
+    """ファイルの更新時刻（存在しない場合は0）"""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+@lru_cache(maxsize=1)
+def _build_config_json(phrases_mtime: int, melodies_mtime: int) -> bytes:
+    """
+    設定情報を読み込んでJSONに変換
 
+    引数の更新時刻はキャッシュのキーとしてのみ使い、
+    どちらかのファイルが更新された時だけ読み込み直す
+    """
     config = {
         "phrases": [],
-        "melodies": []
+        "melodies": [],
+        # クライアントが送信するフレームの最大幅（検出器の縮小幅に合わせる）
+        "detect_width": THRESHOLDS.detect_width
     }
 
     # 定型文を読み込み
-    phrases_path = CONFIG_DIR / "phrases.yaml"
-    if phrases_path.exists():
-        with open(phrases_path, 'r', encoding='utf-8') as f:
-            phrases_data = yaml.safe_load(f)
+    if PHRASES_PATH.exists():
+        with open(PHRASES_PATH, 'r', encoding='utf-8') as f:
+            phrases_data = yaml.load(f, Loader=_SafeLoader)
             config["phrases"] = phrases_data.get("categories", [])
 
     # メロディを読み込み
-    melodies_path = CONFIG_DIR / "melodies.yaml"
-    if melodies_path.exists():
-        with open(melodies_path, 'r', encoding='utf-8') as f:
-            melodies_data = yaml.safe_load(f)
+    if MELODIES_PATH.exists():
+        with open(MELODIES_PATH, 'r', encoding='utf-8') as f:
+            melodies_data = yaml.load(f, Loader=_SafeLoader)
             config["melodies"] = melodies_data.get("melodies", [])
 
-    return config
+    return orjson.dumps(config)
+
+
+@app.get("/api/config")
+async def get_config():
+    """設定情報を返す"""
+    body = _build_config_json(_mtime(PHRASES_PATH), _mtime(MELODIES_PATH))
+    return Response(content=body, media_type="application/json")
 
 
 @app.websocket("/ws")
 async def websocket_route(websocket: WebSocket):
     """WebSocketエンドポイント"""
-    # 各接続ごとに新しいハンドラを作成
-    handler = GestureWebSocketHandler(load_thresholds())
+    # プールから検出器を借りる（空なら待たずに追加で作成）
+    # グラフ構築はイベントループを止めないようスレッドプールで行う
+    try:
+        detector = _detector_pool.get_nowait()
+    except asyncio.QueueEmpty:
+        detector = await asyncio.get_running_loop().run_in_executor(None, _create_detector)
+
+    handler = GestureWebSocketHandler(detector=detector)
     try:
         await websocket_endpoint(websocket, handler)
     finally:
-        handler.close()
+        # 検出がスレッドでまだ実行中なら、終わってから検出器を返す
+        pending = handler.pending_detection
+        if pending is not None and not pending.done():
+            pending.add_done_callback(lambda _: _release_detector(detector))
+        else:
+            _release_detector(detector)
 
 
 @app.get("/api/health")
@@ -111,12 +222,21 @@ def main():
     print("Open http://localhost:8000 in your browser")
     print("=" * 50)
 
+    # 自動リロードは開発時のみ（リロード中は複数ワーカーを使えない）
+    if os.getenv("FACE_COMM_DEV") == "1":
+        run_options = {"reload": True, "reload_dirs": [str(PROJECT_ROOT / "src")]}
+    else:
+        run_options = {"workers": int(os.getenv("WORKERS", "1"))}
+
     uvicorn.run(
         "src.web.app:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        reload_dirs=[str(PROJECT_ROOT / "src")]
+        # uvicorn[standard]で入るC実装を明示的に使う（uvloopはWindows非対応）
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        ws="websockets",
+        **run_options
     )
 
 
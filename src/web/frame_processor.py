@@ -5,10 +5,48 @@ Base64エンコードされた画像をデコードしてOpenCV形式に変換
 """
 
 import base64
+import binascii
 import numpy as np
 import cv2
 from typing import Optional
 
+from ..utils.logger import setup_logger
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    _TJ: Optional["TurboJPEG"] = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    # PyTurboJPEG・libturbojpegがない環境ではOpenCVでJPEGを処理する
+    _TJ = None
+
+logger = setup_logger(__name__)
+
+# エンコード結果に付けるデータURLのヘッダ
+_DATA_URL_HEADER = b"data:image/jpeg;base64,"
+
+
+def decode_jpeg_bytes(image_bytes: bytes) -> Optional[np.ndarray]:
+    """
+    JPEG画像のバイト列をOpenCV形式のnumpy配列に変換
+
+    Args:
+        image_bytes: JPEG画像のバイト列
+
+    Returns:
+        BGR形式のnumpy配列、失敗時はNone
+    """
+    try:
+        if _TJ is not None:
+            return _TJ.decode(image_bytes, pixel_format=TJPF_BGR)
+
+        nparr = np.frombuffer(image_bytes, np.uint8)
+        return cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+
+    except (OSError, ValueError, cv2.error) as e:
+        # 壊れたJPEG（TurboJPEGはOSErrorを送出する）
+        logger.warning("フレームデコードエラー: %s", e)
+        return None
+
 
 def decode_base64_frame(data: str) -> Optional[np.ndarray]:
     """
@@ -25,23 +63,18 @@ def decode_base64_frame(data: str) -> Optional[np.ndarray]:
         # data URL形式の場合、ヘッダを除去
         if data.startswith("data:"):
             # "data:image/jpeg;base64,XXXXX" -> "XXXXX"
-            data = data.split(",", 1)[1]
-
-        # Base64デコード
-        image_bytes = base64.b64decode(data)
+            data = data[data.find(",") + 1:]
 
-        # numpy配列に変換
-        nparr = np.frombuffer(image_bytes, np.uint8)
-
-        # 画像としてデコード
-        frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-
-        return frame
+        # Base64デコード（b64decodeのラッパーを経由せず直接呼ぶ）
+        image_bytes = binascii.a2b_base64(data)
 
-    except Exception as e:
-        print(f"フレームデコードエラー: {e}")
+    except (binascii.Error, ValueError) as e:
+        logger.warning("フレームデコードエラー: %s", e)
         return None
 
+    # 画像としてデコード
+    return decode_jpeg_bytes(image_bytes)
+
 
 def encode_frame_to_base64(frame: np.ndarray, quality: int = 80) -> Optional[str]:
     """
@@ -56,14 +89,15 @@ def encode_frame_to_base64(frame: np.ndarray, quality: int = 80) -> Optional[str
     """
     try:
         # JPEG形式でエンコード
-        encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), quality]
-        _, buffer = cv2.imencode('.jpg', frame, encode_param)
-
-        # Base64エンコード
-        base64_data = base64.b64encode(buffer).decode('utf-8')
+        if _TJ is not None:
+            buffer = _TJ.encode(frame, quality=quality, pixel_format=TJPF_BGR)
+        else:
+            encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), quality]
+            _, buffer = cv2.imencode('.jpg', frame, encode_param)
 
-        return f"data:image/jpeg;base64,{base64_data}"
+        # Base64エンコード（バッファをそのまま渡し、ヘッダと連結してからASCIIとして一度だけ文字列化）
+        return (_DATA_URL_HEADER + base64.b64encode(buffer)).decode('ascii')
 
     except Exception as e:
-        print(f"フレームエンコードエラー: {e}")
+        logger.warning("フレームエンコードエラー: %s", e)
         return None
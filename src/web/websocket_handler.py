@@ -4,31 +4,59 @@ WebSocket処理モジュール
 クライアントからのフレームを受信し、ジェスチャー検出結果を返信
 """
 
-import json
 import time
-from typing import Optional, Callable, Any
+import asyncio
+import orjson
+from collections import deque
+from typing import Optional, Callable, Any, Dict, Union
 from pathlib import Path
 
 from fastapi import WebSocket, WebSocketDisconnect
 
 from ..gesture_detector import GestureDetector, GestureType, Thresholds
-from .frame_processor import decode_base64_frame
+from ..utils.logger import setup_logger
+from .frame_processor import decode_base64_frame, decode_jpeg_bytes
+
+logger = setup_logger(__name__)
+
+
+# ジェスチャータイプの日本語名
+_GESTURE_NAMES: Dict[GestureType, str] = {
+    GestureType.DOUBLE_BLINK: "ダブルまばたき",
+    GestureType.LONG_CLOSE: "長閉じ",
+    GestureType.EYEBROWS_RAISED: "眉上げ",
+    GestureType.MOUTH_OPEN: "口開け",
+    GestureType.HEAD_TILT_LEFT: "左傾き",
+    GestureType.HEAD_TILT_RIGHT: "右傾き",
+}
+
+
+def _ms() -> int:
+    """現在時刻（ミリ秒）"""
+    return time.time_ns() // 1_000_000
 
 
 class GestureWebSocketHandler:
     """WebSocket経由でジェスチャー検出を行うハンドラ"""
 
-    def __init__(self, thresholds: Optional[Thresholds] = None):
+    def __init__(
+        self,
+        thresholds: Optional[Thresholds] = None,
+        detector: Optional[GestureDetector] = None
+    ):
         """
         初期化
 
         Args:
             thresholds: ジェスチャー検出閾値
+            detector: 使用する検出器（省略時は新規作成。渡された場合はthresholdsを無視）
         """
-        self.detector = GestureDetector(thresholds)
+        self.detector = detector if detector is not None else GestureDetector(thresholds)
         self.websocket: Optional[WebSocket] = None
         self.is_connected = False
         self.on_gesture: Optional[Callable[[GestureType], None]] = None
+        # 実行中（または最後に実行した）検出処理
+        self.pending_detection: Optional[asyncio.Future] = None
 
         # ジェスチャー検出時のコールバックを設定
         self.detector.on_gesture_detected = self._handle_gesture
@@ -51,25 +79,32 @@ class GestureWebSocketHandler:
         self.detector.reset()
 
     async def send_json(self, data: dict) -> None:
-        """JSONデータを送信"""
+        """JSONデータを送信（orjsonでシリアライズし、バイナリフレームで送る）"""
         if self.websocket and self.is_connected:
             try:
-                await self.websocket.send_json(data)
+                await self.websocket.send_bytes(
+                    orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+                )
             except Exception as e:
-                print(f"送信エラー: {e}")
+                logger.warning("送信エラー: %s", e)
 
-    async def process_frame(self, frame_data: str) -> dict:
+    async def process_frame(self, frame_data: Union[str, bytes]) -> dict:
         """
         フレームを処理してジェスチャーを検出
 
         Args:
-            frame_data: Base64エンコードされた画像データ
+            frame_data: Base64エンコードされた画像データ、またはJPEGのバイト列
 
         Returns:
             検出結果のdict
         """
-        # フレームをデコード
-        frame = decode_base64_frame(frame_data)
+        # フレームをデコード（JSONのdataに文字列以外が来た場合はデコード失敗として扱う）
+        if isinstance(frame_data, str):
+            frame = decode_base64_frame(frame_data)
+        elif isinstance(frame_data, (bytes, bytearray)):
+            frame = decode_jpeg_bytes(frame_data)
+        else:
+            frame = None
         if frame is None:
             return {
                 "type": "error",
@@ -77,30 +112,36 @@ class GestureWebSocketHandler:
                     "code": "DECODE_ERROR",
                     "message": "フレームのデコードに失敗しました"
                 },
-                "timestamp": int(time.time() * 1000)
+                "timestamp": _ms()
             }
 
         # ジェスチャー検出
-        state, _ = self.detector.detect(frame)
-
-        # 顔状態を返信（numpy.bool_をPython boolに変換）
+        # MediaPipeの推論はイベントループを止めないようスレッドプールで実行する
+        # （待機がキャンセルされても、検出が終わったかどうかを追跡できるようにする）
+        self.pending_detection = asyncio.get_running_loop().run_in_executor(
+            None, self.detector.detect, frame
+        )
+        state, _ = await asyncio.shield(self.pending_detection)
+
+        # 顔状態を返信（numpyの値もorjsonがそのままシリアライズする）
+        # 数値は丸めずに送り、表示桁数はクライアント側で揃える
         result = {
             "type": "face_state",
             "payload": {
-                "face_detected": bool(state.face_detected),
-                "eyes_closed": bool(state.eyes_closed),
-                "left_eye_ar": float(round(state.left_eye_ar, 3)),
-                "right_eye_ar": float(round(state.right_eye_ar, 3)),
-                "mouth_open": bool(state.mouth_open),
-                "mouth_ar": float(round(state.mouth_ar, 3)),
-                "eyebrows_raised": bool(state.eyebrows_raised),
-                "eyebrow_position": float(round(state.eyebrow_position, 4)),
-                "head_tilt_angle": float(round(state.head_tilt_angle, 1)),
-                "head_tilt_left": bool(state.head_tilt_left),
-                "head_tilt_right": bool(state.head_tilt_right),
-                "head_tilt_center": bool(state.head_tilt_center),
+                "face_detected": state.face_detected,
+                "eyes_closed": state.eyes_closed,
+                "left_eye_ar": state.left_eye_ar,
+                "right_eye_ar": state.right_eye_ar,
+                "mouth_open": state.mouth_open,
+                "mouth_ar": state.mouth_ar,
+                "eyebrows_raised": state.eyebrows_raised,
+                "eyebrow_position": state.eyebrow_position,
+                "head_tilt_angle": state.head_tilt_angle,
+                "head_tilt_left": state.head_tilt_left,
+                "head_tilt_right": state.head_tilt_right,
+                "head_tilt_center": state.head_tilt_center,
             },
-            "timestamp": int(time.time() * 1000)
+            "timestamp": _ms()
         }
 
         # ジェスチャーが検出された場合は追加
@@ -114,15 +155,7 @@ class GestureWebSocketHandler:
 
     def _get_gesture_name(self, gesture_type: GestureType) -> str:
         """ジェスチャータイプの日本語名を取得"""
-        names = {
-            GestureType.DOUBLE_BLINK: "ダブルまばたき",
-            GestureType.LONG_CLOSE: "長閉じ",
-            GestureType.EYEBROWS_RAISED: "眉上げ",
-            GestureType.MOUTH_OPEN: "口開け",
-            GestureType.HEAD_TILT_LEFT: "左傾き",
-            GestureType.HEAD_TILT_RIGHT: "右傾き",
-        }
-        return names.get(gesture_type, str(gesture_type))
+        return _GESTURE_NAMES.get(gesture_type, gesture_type.name)
 
     async def handle_message(self, message: dict) -> Optional[dict]:
         """
@@ -146,7 +179,7 @@ class GestureWebSocketHandler:
             # ヘルスチェック
             return {
                 "type": "pong",
-                "timestamp": int(time.time() * 1000)
+                "timestamp": _ms()
             }
 
         elif msg_type == "reset":
@@ -154,7 +187,7 @@ class GestureWebSocketHandler:
             self.detector.reset()
             return {
                 "type": "reset_complete",
-                "timestamp": int(time.time() * 1000)
+                "timestamp": _ms()
             }
 
         return None
@@ -164,6 +197,85 @@ class GestureWebSocketHandler:
         self.detector.close()
 
 
+class _MessageInbox:
+    """
+    受信メッセージの受け箱
+
+    フレームは最新の1枚だけを保持し（古いフレームは捨てる）、
+    ping/resetなどの制御メッセージは受信順にすべて保持する
+    """
+
+    def __init__(self):
+        self.frame: Optional[Union[str, bytes]] = None
+        # 制御メッセージのキュー（Noneは不正なJSONを受信したことを表す）
+        self.controls: deque = deque()
+        self.disconnect_code: Optional[int] = None
+        self._event = asyncio.Event()
+
+    def put_frame(self, frame_data: Union[str, bytes]) -> None:
+        """フレームを格納（未処理のフレームがあれば置き換える）"""
+        self.frame = frame_data
+        self._event.set()
+
+    def put_control(self, message: Optional[dict]) -> None:
+        """制御メッセージを格納（resetより前に届いた未処理のフレームは捨てる）"""
+        if message is not None and message.get("type") == "reset":
+            self.frame = None
+        self.controls.append(message)
+        self._event.set()
+
+    def close(self, code: int) -> None:
+        """切断を通知"""
+        self.disconnect_code = code
+        self._event.set()
+
+    def take_frame(self) -> Optional[Union[str, bytes]]:
+        """最新のフレームを取り出す"""
+        frame_data, self.frame = self.frame, None
+        return frame_data
+
+    async def wait(self) -> None:
+        """新しいメッセージが届くまで待機"""
+        await self._event.wait()
+        self._event.clear()
+
+
+async def _receive_loop(websocket: WebSocket, inbox: _MessageInbox) -> None:
+    """
+    WebSocketからメッセージを受信し続けて受け箱に振り分ける
+
+    検出処理とは別タスクで動かすことで、検出が追いつかない間に届いた
+    フレームはソケットに溜まらず最新の1枚に置き換わる
+    """
+    try:
+        while True:
+            # バイナリフレームはJPEG画像そのもの、テキストフレームはJSONメッセージ
+            received = await websocket.receive()
+            if received["type"] == "websocket.disconnect":
+                inbox.close(received.get("code", 1000))
+                return
+
+            image_bytes = received.get("bytes")
+            if image_bytes is not None:
+                inbox.put_frame(image_bytes)
+                continue
+
+            try:
+                message = orjson.loads(received.get("text", ""))
+            except orjson.JSONDecodeError:
+                inbox.put_control(None)
+                continue
+
+            if message.get("type") == "frame":
+                inbox.put_frame(message.get("payload", {}).get("data", ""))
+            else:
+                inbox.put_control(message)
+
+    except Exception as e:
+        logger.warning("受信エラー: %s", e)
+        inbox.close(1006)
+
+
 async def websocket_endpoint(websocket: WebSocket, handler: GestureWebSocketHandler):
     """
     WebSocketエンドポイントのメイン処理
@@ -180,34 +292,47 @@ async def websocket_endpoint(websocket: WebSocket, handler: GestureWebSocketHand
         "payload": {
             "message": "ジェスチャー検出サーバーに接続しました"
         },
-        "timestamp": int(time.time() * 1000)
+        "timestamp": _ms()
     })
 
+    # 受信は別タスクで行い、検出処理中に届いたフレームは最新の1枚だけ残す
+    inbox = _MessageInbox()
+    receiver = asyncio.create_task(_receive_loop(websocket, inbox))
+
     try:
         while True:
             # メッセージを受信
-            data = await websocket.receive_text()
-
-            try:
-                message = json.loads(data)
-            except json.JSONDecodeError:
-                await handler.send_json({
-                    "type": "error",
-                    "payload": {
-                        "code": "INVALID_JSON",
-                        "message": "無効なJSONフォーマット"
-                    },
-                    "timestamp": int(time.time() * 1000)
-                })
-                continue
-
-            # メッセージを処理
-            response = await handler.handle_message(message)
-            if response:
-                await handler.send_json(response)
+            await inbox.wait()
+            if inbox.disconnect_code is not None:
+                raise WebSocketDisconnect(inbox.disconnect_code)
+
+            # 制御メッセージは捨てずに受信順に処理
+            while inbox.controls:
+                message = inbox.controls.popleft()
+                if message is None:
+                    await handler.send_json({
+                        "type": "error",
+                        "payload": {
+                            "code": "INVALID_JSON",
+                            "message": "無効なJSONフォーマット"
+                        },
+                        "timestamp": _ms()
+                    })
+                    continue
+
+                response = await handler.handle_message(message)
+                if response:
+                    await handler.send_json(response)
+
+            # 最新のフレームだけを処理
+            frame_data = inbox.take_frame()
+            if frame_data is not None:
+                await handler.send_json(await handler.process_frame(frame_data))
 
     except WebSocketDisconnect:
         await handler.disconnect()
     except Exception as e:
-        print(f"WebSocketエラー: {e}")
+        logger.warning("WebSocketエラー: %s", e)
         await handler.disconnect()
+    finally:
+        receiver.cancel()
@@ -117,6 +117,11 @@ class FaceCommApp {
             // カメラを初期化
             await this.camera.init('camera-preview', 'capture-canvas');
 
+            // 送信フレームの幅をサーバーの検出幅に合わせる
+            if (this.config.detect_width !== undefined) {
+                this.camera.captureWidth = this.config.detect_width;
+            }
+
             // WebSocketコールバックを設定
             this._setupWebSocketCallbacks();
 
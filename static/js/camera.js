@@ -14,6 +14,7 @@ class CameraController {
         this.captureInterval = null;
         this.onFrame = null;  // フレームキャプチャ時のコールバック
         this.frameRate = 10;  // 1秒あたりのフレーム数
+        this.captureWidth = 320;  // 送信フレームの最大幅（サーバー設定のdetect_widthで上書き、0で縮小しない）
     }
 
     /**
@@ -57,9 +58,12 @@ class CameraController {
                 };
             });
 
-            // キャンバスサイズをビデオに合わせる
-            this.canvas.width = this.video.videoWidth;
-            this.canvas.height = this.video.videoHeight;
+            // キャンバスサイズをビデオに合わせる（送信幅を超える場合は縮小）
+            const scale = this.captureWidth > 0
+                ? Math.min(1, this.captureWidth / this.video.videoWidth)
+                : 1;
+            this.canvas.width = Math.round(this.video.videoWidth * scale);
+            this.canvas.height = Math.round(this.video.videoHeight * scale);
 
             this.isRunning = true;
             this._startCapture();
@@ -101,16 +105,15 @@ class CameraController {
         this.captureInterval = setInterval(() => {
             if (!this.isRunning || !this.video.videoWidth) return;
 
-            // ビデオフレームをキャンバスに描画
-            this.ctx.drawImage(this.video, 0, 0);
+            // ビデオフレームをキャンバスに縮小して描画
+            this.ctx.drawImage(this.video, 0, 0, this.canvas.width, this.canvas.height);
 
-            // Base64形式で取得
-            const frameData = this.canvas.toDataURL('image/jpeg', 0.7);
-
-            // コールバックを呼び出し
-            if (this.onFrame) {
-                this.onFrame(frameData);
-            }
+            // JPEGのBlobとして取得し、コールバックを呼び出し
+            this.canvas.toBlob((blob) => {
+                if (blob && this.onFrame) {
+                    this.onFrame(blob);
+                }
+            }, 'image/jpeg', 0.7);
         }, interval);
     }
 
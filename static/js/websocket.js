@@ -12,6 +12,9 @@ class GestureWebSocket {
         this.maxReconnectAttempts = 5;
         this.reconnectDelay = 2000;
 
+        // サーバーからのJSONはバイナリフレームで届くため、文字列に戻して解析する
+        this.textDecoder = new TextDecoder();
+
         // コールバック
         this.onConnect = null;
         this.onDisconnect = null;
@@ -38,6 +41,7 @@ class GestureWebSocket {
 
         try {
             this.ws = new WebSocket(url);
+            this.ws.binaryType = 'arraybuffer';
             this._setupEventHandlers();
         } catch (error) {
             console.error('WebSocket接続エラー:', error);
@@ -90,7 +94,8 @@ class GestureWebSocket {
      */
     _handleMessage(data) {
         try {
-            const message = JSON.parse(data);
+            const text = typeof data === 'string' ? data : this.textDecoder.decode(data);
+            const message = JSON.parse(text);
             const type = message.type;
             const payload = message.payload || {};
 
@@ -158,11 +163,19 @@ class GestureWebSocket {
 
     /**
      * フレームを送信
-     * @param {string} frameData - Base64エンコードされた画像データ
+     * @param {Blob|string} frameData - JPEG画像のBlob、またはBase64エンコードされた画像データ
      */
     sendFrame(frameData) {
         if (!this.isConnected) return;
 
+        // BlobはJSONに包まずバイナリフレームでそのまま送る
+        if (frameData instanceof Blob) {
+            if (this.ws && this.ws.readyState === WebSocket.OPEN) {
+                this.ws.send(frameData);
+            }
+            return;
+        }
+
         const message = {
             type: 'frame',
             payload: {
@@ -12,6 +12,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 import pytest
 import numpy as np
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from src.gesture_detector import (
@@ -33,6 +34,7 @@ class TestThresholds:
         assert thresholds.eye_ar_threshold == 0.20
         assert thresholds.mouth_ar_threshold == 0.30
         assert thresholds.head_tilt_threshold == 15.0
+        assert thresholds.detect_every == 1
     
     def test_custom_values(self):
         """カスタム値のテスト"""
@@ -43,6 +45,19 @@ class TestThresholds:
         
         assert thresholds.eye_ar_threshold == 0.25
         assert thresholds.mouth_ar_threshold == 0.35
+    
+    def test_from_yaml(self):
+        """設定ファイルからの読み込みのテスト"""
+        config_path = PROJECT_ROOT / "config" / "thresholds.yaml"
+        thresholds = Thresholds.from_yaml(str(config_path))
+        
+        assert thresholds.eye_ar_threshold == 0.20
+        assert thresholds.head_tilt_deadzone == 7.0
+        
+        # 2回目はキャッシュから読み込まれ、別のインスタンスが返る
+        again = Thresholds.from_yaml(str(config_path))
+        assert again == thresholds
+        assert again is not thresholds
 
 
 class TestGestureState:
@@ -78,11 +93,15 @@ class TestGestureDetector:
         """リセット機能のテスト"""
         detector.blink_count = 5
         detector.last_blink_time = 100.0
+        detector.eye_closed_streak = 12
+        detector.mouth_open_streak = 3
         
         detector.reset()
         
         assert detector.blink_count == 0
         assert detector.last_blink_time == 0.0
+        assert detector.eye_closed_streak == 0
+        assert detector.mouth_open_streak == 0
     
     def test_update_thresholds(self, detector):
         """閾値更新のテスト"""
@@ -100,6 +119,102 @@ class TestGestureDetector:
         detector._confirm_gesture(GestureType.DOUBLE_BLINK)
         assert detector._is_gesture_available(GestureType.DOUBLE_BLINK) == False
 
+    def test_gesture_cooldown_with_time(self, detector):
+        """時刻を渡した場合のクールダウンのテスト"""
+        cooldown = detector.thresholds.gesture_cooldown
+        detector._confirm_gesture(GestureType.MOUTH_OPEN, 100.0)
+        
+        assert detector._is_gesture_available(GestureType.MOUTH_OPEN, 100.0) == False
+        assert detector._is_gesture_available(GestureType.MOUTH_OPEN, 100.0 + cooldown) == True
+
+    def _set_face(self, detector, nose, chin, eyes_open=False):
+        """鼻先と顎の位置を指定した顔をMediaPipeの結果として返すよう設定"""
+        landmarks = [SimpleNamespace(x=0.5, y=0.5) for _ in range(468)]
+        landmarks[FaceLandmarks.NOSE_TIP] = SimpleNamespace(x=nose[0], y=nose[1])
+        landmarks[FaceLandmarks.CHIN] = SimpleNamespace(x=chin[0], y=chin[1])
+        if eyes_open:
+            # 縦0.06・横0.1（EAR 0.6）の目
+            for top, bottom, left, right in (
+                (FaceLandmarks.RIGHT_EYE_TOP, FaceLandmarks.RIGHT_EYE_BOTTOM,
+                 FaceLandmarks.RIGHT_EYE_LEFT, FaceLandmarks.RIGHT_EYE_RIGHT),
+                (FaceLandmarks.LEFT_EYE_TOP, FaceLandmarks.LEFT_EYE_BOTTOM,
+                 FaceLandmarks.LEFT_EYE_LEFT, FaceLandmarks.LEFT_EYE_RIGHT),
+            ):
+                landmarks[top] = SimpleNamespace(x=0.5, y=0.47)
+                landmarks[bottom] = SimpleNamespace(x=0.5, y=0.53)
+                landmarks[left] = SimpleNamespace(x=0.45, y=0.5)
+                landmarks[right] = SimpleNamespace(x=0.55, y=0.5)
+        face = SimpleNamespace(landmark=landmarks)
+        detector.face_mesh.process.return_value = SimpleNamespace(multi_face_landmarks=[face])
+    
+    def test_head_tilt_classification(self, detector):
+        """頭の傾き判定のテスト"""
+        detector.update_thresholds(Thresholds(detect_every=1))
+        frame = np.zeros((480, 640, 3), np.uint8)
+        
+        # 鼻が顎の真上: 中央
+        self._set_face(detector, nose=(0.5, 0.4), chin=(0.5, 0.6))
+        state, _ = detector.detect(frame)
+        assert state.head_tilt_center == True
+        assert abs(state.head_tilt_angle) == pytest.approx(180.0)
+        
+        # 鼻が顎より右: 右傾き
+        self._set_face(detector, nose=(0.6, 0.4), chin=(0.5, 0.6))
+        state, _ = detector.detect(frame)
+        assert state.head_tilt_center == False
+        assert state.head_tilt_right == True
+        assert state.head_tilt_left == False
+        assert 0 < state.head_tilt_angle < 180 - detector.thresholds.head_tilt_deadzone
+        
+        # 鼻が顎より左: 左傾き
+        self._set_face(detector, nose=(0.4, 0.4), chin=(0.5, 0.6))
+        state, _ = detector.detect(frame)
+        assert state.head_tilt_left == True
+        assert state.head_tilt_right == False
+    
+    def test_landmark_reuse(self, detector):
+        """Face Meshを間引いて実行するテスト"""
+        detector.update_thresholds(Thresholds(detect_every=2))
+        frame = np.zeros((480, 640, 3), np.uint8)
+        self._set_face(detector, nose=(0.5, 0.4), chin=(0.5, 0.6))
+        
+        for _ in range(4):
+            state, _ = detector.detect(frame)
+            assert state.face_detected == True
+        assert detector.face_mesh.process.call_count == 2
+        
+        # リセット後は必ずFace Meshを実行する
+        detector.reset()
+        detector.detect(frame)
+        assert detector.face_mesh.process.call_count == 3
+
+    def test_streaks_on_reused_landmarks(self, detector):
+        """Face Meshを間引いたフレームでの目の状態と連続フレーム数のテスト"""
+        detector.update_thresholds(Thresholds(detect_every=2))
+        frame = np.zeros((480, 640, 3), np.uint8)
+        
+        # 目を閉じた顔: 使い回したフレームでも閉じたまま数えられる
+        self._set_face(detector, nose=(0.5, 0.4), chin=(0.5, 0.6), eyes_open=False)
+        for _ in range(3):
+            state, _ = detector.detect(frame)
+            assert state.eyes_closed == True
+        assert detector.eye_closed_streak == 3
+        assert detector.face_mesh.process.call_count == 2
+        
+        # 使い回すフレームでは目を開けたことはまだ反映されない
+        self._set_face(detector, nose=(0.5, 0.4), chin=(0.5, 0.6), eyes_open=True)
+        state, _ = detector.detect(frame)
+        assert state.eyes_closed == True
+        assert detector.eye_closed_streak == 4
+        assert detector.face_mesh.process.call_count == 2
+        
+        # 次にFace Meshを実行したフレームで反映され、まばたきとして数えられる
+        state, _ = detector.detect(frame)
+        assert detector.face_mesh.process.call_count == 3
+        assert state.eyes_closed == False
+        assert detector.eye_closed_streak == 0
+        assert detector.blink_count == 1
+
 
 class TestFaceLandmarks:
     """顔ランドマーク定義のテスト"""
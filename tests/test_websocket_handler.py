@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+WebSocket受信処理のユニットテスト
+"""
+
+import sys
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import asyncio
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+
+from src.web.websocket_handler import (
+    GestureWebSocketHandler,
+    _MessageInbox,
+    _receive_loop,
+    websocket_endpoint
+)
+
+
+def _binary(data: bytes) -> dict:
+    """バイナリフレームの受信メッセージ"""
+    return {"type": "websocket.receive", "bytes": data}
+
+
+def _text(message) -> dict:
+    """テキストフレームの受信メッセージ（dictはJSONに変換）"""
+    if not isinstance(message, str):
+        message = orjson.dumps(message).decode()
+    return {"type": "websocket.receive", "text": message}
+
+
+def _disconnect(code: int = 1000) -> dict:
+    """切断の受信メッセージ"""
+    return {"type": "websocket.disconnect", "code": code}
+
+
+async def _settle() -> None:
+    """他のタスクが待機状態になるまで処理を進める"""
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+class FakeWebSocket:
+    """キューに入れたメッセージを順に受信するWebSocketの代用"""
+
+    def __init__(self, *messages):
+        self.incoming: asyncio.Queue = asyncio.Queue()
+        for message in messages:
+            self.incoming.put_nowait(message)
+
+    async def receive(self) -> dict:
+        return await self.incoming.get()
+
+
+class FakeHandler:
+    """呼び出しを記録するジェスチャーハンドラの代用"""
+
+    def __init__(self):
+        self.frames = []
+        self.messages = []
+        self.sent = []
+        self.disconnected = False
+
+    async def connect(self, websocket) -> None:
+        pass
+
+    async def send_json(self, data: dict) -> None:
+        self.sent.append(data["type"])
+
+    async def process_frame(self, frame_data) -> dict:
+        self.frames.append(frame_data)
+        return {"type": "face_state"}
+
+    async def handle_message(self, message: dict) -> dict:
+        self.messages.append(message["type"])
+        return {"type": "pong"} if message["type"] == "ping" else None
+
+    async def disconnect(self) -> None:
+        self.disconnected = True
+
+
+class TestReceiveLoop:
+    """受信ループのテスト"""
+
+    def test_latest_frame_wins(self):
+        """未処理のフレームは最新の1枚に置き換わるテスト"""
+        async def run():
+            inbox = _MessageInbox()
+            websocket = FakeWebSocket(
+                _binary(b"1"),
+                _text({"type": "frame", "payload": {"data": "2"}}),
+                _binary(b"3"),
+                _disconnect(),
+            )
+            await _receive_loop(websocket, inbox)
+            return inbox
+
+        inbox = asyncio.run(run())
+        assert inbox.take_frame() == b"3"
+        assert inbox.take_frame() is None
+
+    def test_controls_kept_in_order(self):
+        """制御メッセージと不正なJSONは受信順に残るテスト"""
+        async def run():
+            inbox = _MessageInbox()
+            websocket = FakeWebSocket(
+                _text({"type": "ping"}),
+                _binary(b"1"),
+                _text("{invalid"),
+                _text({"type": "ping", "timestamp": 1}),
+                _disconnect(),
+            )
+            await _receive_loop(websocket, inbox)
+            return inbox
+
+        inbox = asyncio.run(run())
+        controls = list(inbox.controls)
+        assert controls[0] == {"type": "ping"}
+        assert controls[1] is None
+        assert controls[2] == {"type": "ping", "timestamp": 1}
+        assert inbox.frame == b"1"
+
+    def test_reset_discards_pending_frame(self):
+        """resetより前に届いたフレームは捨てられるテスト"""
+        async def run():
+            inbox = _MessageInbox()
+            websocket = FakeWebSocket(
+                _binary(b"old"),
+                _text({"type": "reset"}),
+                _disconnect(),
+            )
+            await _receive_loop(websocket, inbox)
+            return inbox
+
+        inbox = asyncio.run(run())
+        assert inbox.frame is None
+        assert [m["type"] for m in inbox.controls] == ["reset"]
+
+        # reset後に届いたフレームは残る
+        inbox.put_frame(b"new")
+        assert inbox.frame == b"new"
+
+    def test_disconnect_code(self):
+        """切断コードが受け箱に通知されるテスト"""
+        async def run():
+            inbox = _MessageInbox()
+            await _receive_loop(FakeWebSocket(_disconnect(1001)), inbox)
+            return inbox
+
+        inbox = asyncio.run(run())
+        assert inbox.disconnect_code == 1001
+
+
+class TestWebSocketEndpoint:
+    """WebSocketエンドポイントのテスト"""
+
+    def test_processes_controls_then_latest_frame(self):
+        """制御メッセージを順に処理してから最新のフレームだけを処理するテスト"""
+        async def run():
+            handler = FakeHandler()
+            websocket = FakeWebSocket(
+                _binary(b"1"),
+                _text({"type": "ping"}),
+                _text("{invalid"),
+                _binary(b"2"),
+            )
+            endpoint = asyncio.create_task(websocket_endpoint(websocket, handler))
+            await _settle()
+
+            websocket.incoming.put_nowait(_disconnect())
+            await asyncio.wait_for(endpoint, timeout=1.0)
+            return handler
+
+        handler = asyncio.run(run())
+        assert handler.messages == ["ping"]
+        assert handler.frames == [b"2"]
+        assert handler.sent == ["connected", "pong", "error", "face_state"]
+        assert handler.disconnected == True
+
+    def test_disconnect_propagates(self):
+        """切断されるとエンドポイントが終了するテスト"""
+        async def run():
+            handler = FakeHandler()
+            websocket = FakeWebSocket(_disconnect())
+            await asyncio.wait_for(websocket_endpoint(websocket, handler), timeout=1.0)
+            return handler
+
+        handler = asyncio.run(run())
+        assert handler.disconnected == True
+        assert handler.frames == []
+
+
+class TestProcessFrame:
+    """フレーム処理のテスト"""
+
+    @pytest.mark.parametrize("frame_data", [123, [1, 2], {"data": "x"}, None])
+    def test_invalid_frame_data(self, frame_data):
+        """文字列・バイト列以外のフレームはデコードエラーを返すテスト"""
+        detector = MagicMock()
+        handler = GestureWebSocketHandler(detector=detector)
+
+        result = asyncio.run(handler.process_frame(frame_data))
+
+        assert result["type"] == "error"
+        assert result["payload"]["code"] == "DECODE_ERROR"
+        detector.detect.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])